@@ -28,6 +28,8 @@ import com.nimbusds.oauth2.sdk.GeneralException;
 import io.netty.util.HashedWheelTimer;
 import io.netty.util.Timer;
 import org.apache.velocity.app.VelocityEngine;
+import org.glassfish.jersey.client.filter.EncodingFilter;
+import org.glassfish.jersey.message.GZipEncoder;
 import org.traccar.broadcast.BroadcastService;
 import org.traccar.broadcast.MulticastBroadcastService;
 import org.traccar.broadcast.RedisBroadcastService;
@@ -109,6 +111,7 @@ import java.net.URISyntaxException;
 import java.util.Properties;
 import java.util.concurrent.ExecutorService;
 import java.util.concurrent.Executors;
+import java.util.concurrent.TimeUnit;
 
 public class MainModule extends AbstractModule {
 
@@ -152,8 +155,15 @@ public class MainModule extends AbstractModule {
 
     @Singleton
     @Provides
-    public static Client provideClient(ObjectMapperContextResolver objectMapperContextResolver) {
-        return ClientBuilder.newClient().register(objectMapperContextResolver);
+    public static Client provideClient(Config config, ObjectMapperContextResolver objectMapperContextResolver) {
+        long timeout = config.getLong(Keys.SERVER_HTTP_TIMEOUT);
+        return ClientBuilder.newBuilder()
+                .connectTimeout(timeout, TimeUnit.MILLISECONDS)
+                .readTimeout(timeout, TimeUnit.MILLISECONDS)
+                .build()
+                .register(objectMapperContextResolver)
+                .register(GZipEncoder.class)
+                .register(EncodingFilter.class);
     }
 
     @Singleton
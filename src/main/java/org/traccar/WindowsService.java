@@ -28,12 +28,16 @@ import com.sun.jna.platform.win32.Winsvc.SERVICE_STATUS;
 import com.sun.jna.platform.win32.Winsvc.SERVICE_STATUS_HANDLE;
 import com.sun.jna.platform.win32.Winsvc.SERVICE_TABLE_ENTRY;
 import jnr.posix.POSIXFactory;
+import org.slf4j.Logger;
+import org.slf4j.LoggerFactory;
 
 import java.io.File;
 import java.net.URISyntaxException;
 
 public abstract class WindowsService {
 
+    private static final Logger LOGGER = LoggerFactory.getLogger(WindowsService.class);
+
     private static final Advapi32 ADVAPI_32 = Advapi32.INSTANCE;
 
     private final Object waitObject = new Object();
@@ -188,7 +192,7 @@ public abstract class WindowsService {
                     waitObject.wait();
                 }
             } catch (InterruptedException e) {
-                e.printStackTrace();
+                LOGGER.warn("Service wait interrupted", e);
             }
 
             reportStatus(Winsvc.SERVICE_STOPPED, WinError.NO_ERROR, 0);
@@ -39,6 +39,7 @@ public class CorsResponseFilter implements ContainerResponseFilter {
     private static final String ORIGIN_ALL = "*";
     private static final String HEADERS_ALL = "origin, content-type, accept, authorization";
     private static final String METHODS_ALL = "GET, POST, PUT, DELETE, OPTIONS";
+    private static final String MAX_AGE_DAY = "86400";
 
     @Override
     public void filter(ContainerRequestContext request, ContainerResponseContext response) throws IOException {
@@ -54,6 +55,10 @@ public class CorsResponseFilter implements ContainerResponseFilter {
             response.getHeaders().add(HttpHeaderNames.ACCESS_CONTROL_ALLOW_METHODS.toString(), METHODS_ALL);
         }
 
+        if (!response.getHeaders().containsKey(HttpHeaderNames.ACCESS_CONTROL_MAX_AGE.toString())) {
+            response.getHeaders().add(HttpHeaderNames.ACCESS_CONTROL_MAX_AGE.toString(), MAX_AGE_DAY);
+        }
+
         if (!response.getHeaders().containsKey(HttpHeaderNames.ACCESS_CONTROL_ALLOW_ORIGIN.toString())) {
             String origin = request.getHeaderString(HttpHeaderNames.ORIGIN.toString());
             if (origin == null) {
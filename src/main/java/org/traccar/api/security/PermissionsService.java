@@ -35,7 +35,11 @@ import org.traccar.storage.query.Condition;
 import org.traccar.storage.query.Request;
 
 import jakarta.inject.Inject;
+import java.util.HashMap;
+import java.util.HashSet;
+import java.util.Map;
 import java.util.Objects;
+import java.util.Set;
 
 @RequestScoped
 public class PermissionsService {
@@ -45,6 +49,8 @@ public class PermissionsService {
     private Server server;
     private User user;
 
+    private final Map<Class<?>, Set<Long>> permitted = new HashMap<>();
+
     @Inject
     public PermissionsService(Storage storage) {
         this.storage = storage;
@@ -211,6 +217,10 @@ public class PermissionsService {
     public <T extends BaseModel> void checkPermission(
             Class<T> clazz, long userId, long objectId) throws StorageException, SecurityException {
         if (!getUser(userId).getAdministrator() && !(clazz.equals(User.class) && userId == objectId)) {
+            Set<Long> permittedIds = permitted.computeIfAbsent(clazz, key -> new HashSet<>());
+            if (permittedIds.contains(objectId)) {
+                return;
+            }
             var object = storage.getObject(clazz, new Request(
                     new Columns.Include("id"),
                     new Condition.And(
@@ -220,7 +230,12 @@ public class PermissionsService {
             if (object == null) {
                 throw new SecurityException(clazz.getSimpleName() + " access denied");
             }
+            permittedIds.add(objectId);
         }
     }
 
+    public void invalidatePermissions() {
+        permitted.clear();
+    }
+
 }
@@ -330,6 +330,15 @@ public final class Keys {
             "server.timeout",
             List.of(KeyType.CONFIG));
 
+    /**
+     * Connect and read timeout in milliseconds for outgoing HTTP requests, such as geocoding, geolocation, event
+     * forwarding and SMS gateways. Default timeout is 30 seconds. Zero means no timeout.
+     */
+    public static final ConfigKey<Long> SERVER_HTTP_TIMEOUT = new LongConfigKey(
+            "server.httpTimeout",
+            List.of(KeyType.CONFIG),
+            30000L);
+
     /**
      * Send device responses immediately before writing it in the database.
      */
@@ -1366,8 +1375,9 @@ public final class Keys {
             List.of(KeyType.CONFIG));
 
     /**
-     * Maximum time period for reports in seconds. Can be useful to prevent users from requesting unreasonably long
-     * reports. By default, there is no limit.
+     * Maximum time period for reports in seconds. Also applies to position history requests (/api/positions with
+     * from and to) and to the KML, CSV and GPX position exports. Can be useful to prevent users from requesting
+     * unreasonably long reports. By default, there is no limit.
      */
     public static final ConfigKey<Long> REPORT_PERIOD_LIMIT = new LongConfigKey(
             "report.periodLimit",
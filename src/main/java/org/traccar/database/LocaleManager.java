@@ -31,12 +31,14 @@ import java.util.Collections;
 import java.util.Map;
 import java.util.Objects;
 import java.util.concurrent.ConcurrentHashMap;
+import java.util.regex.Pattern;
 import java.util.stream.Stream;
 
 @Singleton
 public class LocaleManager {
 
     private static final String DEFAULT_LANGUAGE = "en";
+    private static final Pattern LANGUAGE_PATTERN = Pattern.compile("^[A-Za-z0-9_-]+$");
 
     private final Path path;
     private final ObjectMapper objectMapper;
@@ -82,7 +84,7 @@ public class LocaleManager {
     }
 
     private static String sanitizeLanguage(String language) {
-        if (language != null && !language.matches("^[A-Za-z0-9_-]+$")) {
+        if (language != null && !LANGUAGE_PATTERN.matcher(language).matches()) {
             throw new IllegalArgumentException("Invalid language");
         }
         return language;
@@ -32,7 +32,7 @@ public final class Hashing {
         try {
             factory = SecretKeyFactory.getInstance("PBKDF2WithHmacSHA1");
         } catch (NoSuchAlgorithmException e) {
-            e.printStackTrace();
+            throw new IllegalStateException("Password hashing algorithm not available", e);
         }
     }
 
@@ -20,6 +20,7 @@ import org.traccar.helper.model.PositionUtil;
 import org.traccar.helper.model.UserUtil;
 import org.traccar.model.Geofence;
 import org.traccar.model.Position;
+import org.traccar.reports.common.ReportUtils;
 import org.traccar.storage.Storage;
 import org.traccar.storage.StorageException;
 
@@ -41,11 +42,13 @@ public class CsvExportProvider {
 
     private final Storage storage;
     private final PermissionsService permissionsService;
+    private final ReportUtils reportUtils;
 
     @Inject
-    public CsvExportProvider(Storage storage, PermissionsService permissionsService) {
+    public CsvExportProvider(Storage storage, PermissionsService permissionsService, ReportUtils reportUtils) {
         this.storage = storage;
         this.permissionsService = permissionsService;
+        this.reportUtils = reportUtils;
     }
 
     static String formatCell(Object value) {
@@ -64,6 +67,8 @@ public class CsvExportProvider {
             OutputStream outputStream, long userId, long deviceId, long geofenceId,
             Date from, Date to) throws StorageException {
 
+        reportUtils.checkPeriodLimit(from, to);
+
         var server = permissionsService.getServer();
         var user = permissionsService.getUser(userId);
         var positions = PositionUtil.getPositions(storage, deviceId, from, to);
@@ -33,6 +33,8 @@ import java.util.Collection;
 import java.util.Comparator;
 import java.util.Date;
 import java.util.HashMap;
+import java.util.HashSet;
+import java.util.Set;
 
 public class GeofenceReportProvider {
 
@@ -63,12 +65,13 @@ public class GeofenceReportProvider {
             Date from, Date to) throws StorageException {
         reportUtils.checkPeriodLimit(from, to);
 
+        Set<Long> geofenceIdSet = new HashSet<>(geofenceIds);
         var result = new ArrayList<GeofenceReportItem>();
         for (Device device : DeviceUtil.getAccessibleDevices(storage, userId, deviceIds, groupIds)) {
             var openEvents = new HashMap<Long, Event>();
             for (Event event : getEvents(device.getId(), from, to)) {
                 long geofenceId = event.getGeofenceId();
-                if (geofenceIds.contains(geofenceId)) {
+                if (geofenceIdSet.contains(geofenceId)) {
                     if (Event.TYPE_GEOFENCE_ENTER.equals(event.getType())) {
                         openEvents.put(geofenceId, event);
                     } else if (Event.TYPE_GEOFENCE_EXIT.equals(event.getType())) {
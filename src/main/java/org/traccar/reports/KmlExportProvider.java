@@ -17,6 +17,7 @@ package org.traccar.reports;
 
 import org.traccar.helper.model.PositionUtil;
 import org.traccar.model.Device;
+import org.traccar.reports.common.ReportUtils;
 import org.traccar.storage.Storage;
 import org.traccar.storage.StorageException;
 import org.traccar.storage.query.Columns;
@@ -36,16 +37,20 @@ import javax.xml.stream.XMLStreamWriter;
 public class KmlExportProvider {
 
     private final Storage storage;
+    private final ReportUtils reportUtils;
 
     @Inject
-    public KmlExportProvider(Storage storage) {
+    public KmlExportProvider(Storage storage, ReportUtils reportUtils) {
         this.storage = storage;
+        this.reportUtils = reportUtils;
     }
 
     public void generate(
             OutputStream outputStream, long deviceId, Date from, Date to)
             throws StorageException, XMLStreamException {
 
+        reportUtils.checkPeriodLimit(from, to);
+
         var device = storage.getObject(Device.class, new Request(
                 new Columns.All(), new Condition.Equals("id", deviceId)));
         var positions = PositionUtil.getPositions(storage, deviceId, from, to);
@@ -44,6 +44,12 @@ import java.util.Collection;
 import java.util.Date;
 import java.util.Map;
 import java.util.HashMap;
+import java.util.Iterator;
+import java.util.Spliterator;
+import java.util.Spliterators;
+import java.util.function.Consumer;
+import java.util.stream.Stream;
+import java.util.stream.StreamSupport;
 
 public class RouteReportProvider {
 
@@ -60,15 +66,55 @@ public class RouteReportProvider {
         this.storage = storage;
     }
 
-    public Collection<Position> getObjects(long userId, Collection<Long> deviceIds, Collection<Long> groupIds,
+    public Stream<Position> getObjects(long userId, Collection<Long> deviceIds, Collection<Long> groupIds,
             Date from, Date to) throws StorageException {
         reportUtils.checkPeriodLimit(from, to);
 
-        ArrayList<Position> result = new ArrayList<>();
-        for (Device device: DeviceUtil.getAccessibleDevices(storage, userId, deviceIds, groupIds)) {
-            result.addAll(PositionUtil.getPositions(storage, device.getId(), from, to));
+        var devices = DeviceUtil.getAccessibleDevices(storage, userId, deviceIds, groupIds).iterator();
+        var spliterator = new DevicePositionsSpliterator(devices, from, to);
+        return StreamSupport.stream(spliterator, false).onClose(spliterator::close);
+    }
+
+    private class DevicePositionsSpliterator extends Spliterators.AbstractSpliterator<Position> {
+
+        private final Iterator<Device> devices;
+        private final Date from;
+        private final Date to;
+
+        private Stream<Position> positions;
+        private Spliterator<Position> current;
+
+        DevicePositionsSpliterator(Iterator<Device> devices, Date from, Date to) {
+            super(Long.MAX_VALUE, Spliterator.ORDERED);
+            this.devices = devices;
+            this.from = from;
+            this.to = to;
+        }
+
+        @Override
+        public boolean tryAdvance(Consumer<? super Position> action) {
+            while (current == null || !current.tryAdvance(action)) {
+                close();
+                if (!devices.hasNext()) {
+                    return false;
+                }
+                try {
+                    positions = PositionUtil.getPositionsStream(storage, devices.next().getId(), from, to);
+                } catch (StorageException e) {
+                    throw new RuntimeException(e);
+                }
+                current = positions.spliterator();
+            }
+            return true;
+        }
+
+        void close() {
+            if (positions != null) {
+                positions.close();
+                positions = null;
+                current = null;
+            }
         }
-        return result;
     }
 
 
@@ -24,6 +24,7 @@ import org.traccar.config.Keys;
 
 import jakarta.inject.Inject;
 import jakarta.ws.rs.client.Client;
+import jakarta.ws.rs.core.Response;
 
 import java.util.concurrent.ScheduledExecutorService;
 import java.util.concurrent.TimeUnit;
@@ -80,9 +81,10 @@ public class TaskHealthCheck implements ScheduleTask {
     public void run() {
         LOGGER.debug("Health check running");
         if (System.currentTimeMillis() > gracePeriod) {
-            int status = client.target(getUrl()).request().get().getStatus();
-            if (status == 200) {
-                systemD.sd_notify(0, "WATCHDOG=1");
+            try (Response response = client.target(getUrl()).request().get()) {
+                if (response.getStatus() / 100 == 2) {
+                    systemD.sd_notify(0, "WATCHDOG=1");
+                }
             }
         } else {
             systemD.sd_notify(0, "WATCHDOG=1");
@@ -25,8 +25,12 @@ import jakarta.ws.rs.client.AsyncInvoker;
 import jakarta.ws.rs.client.Client;
 import jakarta.ws.rs.client.InvocationCallback;
 
+import java.util.regex.Pattern;
+
 public class OverpassSpeedLimitProvider implements SpeedLimitProvider {
 
+    private static final Pattern SPEED_PATTERN = Pattern.compile("\\d+");
+
     private final Client client;
     private final String url;
 
@@ -41,7 +45,7 @@ public class OverpassSpeedLimitProvider implements SpeedLimitProvider {
             return UnitsConverter.knotsFromMph(Double.parseDouble(value.substring(0, value.length() - 4)));
         } else if (value.endsWith(" knots")) {
             return Double.parseDouble(value.substring(0, value.length() - 6));
-        } else if (value.matches("\\d+")) {
+        } else if (SPEED_PATTERN.matcher(value).matches()) {
             return UnitsConverter.knotsFromKph(Double.parseDouble(value));
         } else {
             return null;
@@ -29,7 +29,6 @@ import org.eclipse.jetty.ee10.servlet.ServletHolder;
 import org.eclipse.jetty.ee10.servlet.SessionHandler;
 import org.eclipse.jetty.ee10.websocket.server.config.JettyWebSocketServletContainerInitializer;
 import org.eclipse.jetty.http.HttpCookie;
-import org.eclipse.jetty.server.Handler;
 import org.eclipse.jetty.server.RequestLogWriter;
 import org.eclipse.jetty.server.Server;
 import org.eclipse.jetty.session.DatabaseAdaptor;
@@ -97,11 +96,10 @@ public class WebServer implements LifecycleObject {
 
         initWebApp(servletHandler);
 
-        Handler.Sequence handlers = new Handler.Sequence();
         initClientProxy(servletHandler);
-        handlers.addHandler(servletHandler);
-        handlers.addHandler(new CompressionHandler());
-        server.setHandler(handlers);
+        CompressionHandler compressionHandler = new CompressionHandler();
+        compressionHandler.setHandler(servletHandler);
+        server.setHandler(compressionHandler);
 
         if (config.hasKey(Keys.WEB_REQUEST_LOG_PATH)) {
             RequestLogWriter logWriter = new RequestLogWriter(config.getString(Keys.WEB_REQUEST_LOG_PATH));
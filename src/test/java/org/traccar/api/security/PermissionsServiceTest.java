@@ -0,0 +1,62 @@
+package org.traccar.api.security;
+
+import org.junit.jupiter.api.BeforeEach;
+import org.junit.jupiter.api.Test;
+import org.traccar.model.Device;
+import org.traccar.model.User;
+import org.traccar.storage.Storage;
+
+import static org.junit.jupiter.api.Assertions.assertThrows;
+import static org.mockito.ArgumentMatchers.any;
+import static org.mockito.ArgumentMatchers.eq;
+import static org.mockito.Mockito.mock;
+import static org.mockito.Mockito.times;
+import static org.mockito.Mockito.verify;
+import static org.mockito.Mockito.when;
+
+public class PermissionsServiceTest {
+
+    private Storage storage;
+    private PermissionsService permissionsService;
+
+    @BeforeEach
+    public void setUp() throws Exception {
+        storage = mock(Storage.class);
+        User user = new User();
+        user.setId(1);
+        when(storage.getObject(eq(User.class), any())).thenReturn(user);
+        permissionsService = new PermissionsService(storage);
+    }
+
+    @Test
+    public void testGrantedPermissionCached() throws Exception {
+        when(storage.getObject(eq(Device.class), any())).thenReturn(new Device());
+
+        permissionsService.checkPermission(Device.class, 1, 2);
+        permissionsService.checkPermission(Device.class, 1, 2);
+
+        verify(storage, times(1)).getObject(eq(Device.class), any());
+    }
+
+    @Test
+    public void testDeniedPermissionNotCached() throws Exception {
+        when(storage.getObject(eq(Device.class), any())).thenReturn(null);
+
+        assertThrows(SecurityException.class, () -> permissionsService.checkPermission(Device.class, 1, 2));
+        assertThrows(SecurityException.class, () -> permissionsService.checkPermission(Device.class, 1, 2));
+
+        verify(storage, times(2)).getObject(eq(Device.class), any());
+    }
+
+    @Test
+    public void testInvalidatePermissions() throws Exception {
+        when(storage.getObject(eq(Device.class), any())).thenReturn(new Device(), (Device) null);
+
+        permissionsService.checkPermission(Device.class, 1, 2);
+        permissionsService.invalidatePermissions();
+
+        assertThrows(SecurityException.class, () -> permissionsService.checkPermission(Device.class, 1, 2));
+        verify(storage, times(2)).getObject(eq(Device.class), any());
+    }
+
+}
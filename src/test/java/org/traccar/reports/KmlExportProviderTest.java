@@ -1,8 +1,13 @@
 package org.traccar.reports;
 
+import org.apache.velocity.app.VelocityEngine;
 import org.junit.jupiter.api.Test;
+import org.traccar.api.security.PermissionsService;
+import org.traccar.config.Config;
+import org.traccar.config.Keys;
 import org.traccar.model.Device;
 import org.traccar.model.Position;
+import org.traccar.reports.common.ReportUtils;
 import org.traccar.storage.Storage;
 
 import java.io.ByteArrayOutputStream;
@@ -12,6 +17,7 @@ import java.util.TimeZone;
 import java.util.stream.Stream;
 
 import static org.junit.jupiter.api.Assertions.assertEquals;
+import static org.junit.jupiter.api.Assertions.assertThrows;
 import static org.mockito.ArgumentMatchers.any;
 import static org.mockito.ArgumentMatchers.eq;
 import static org.mockito.Mockito.mock;
@@ -19,6 +25,10 @@ import static org.mockito.Mockito.when;
 
 public class KmlExportProviderTest {
 
+    private ReportUtils createReportUtils(Config config, Storage storage) {
+        return new ReportUtils(config, storage, mock(PermissionsService.class), mock(VelocityEngine.class), null);
+    }
+
     @Test
     public void testGenerateOutput() throws Exception {
         Storage storage = mock(Storage.class);
@@ -33,13 +43,15 @@ public class KmlExportProviderTest {
         position.setAltitude(30.75);
         when(storage.getObjectsStream(eq(Position.class), any())).thenReturn(Stream.of(position));
 
+        var provider = new KmlExportProvider(storage, createReportUtils(mock(Config.class), storage));
+
         ByteArrayOutputStream outputStream = new ByteArrayOutputStream();
         Date from = new Date(0);
         Date to = new Date(60_000);
         TimeZone defaultTimeZone = TimeZone.getDefault();
         TimeZone.setDefault(TimeZone.getTimeZone("UTC"));
         try {
-            new KmlExportProvider(storage).generate(outputStream, 1, from, to);
+            provider.generate(outputStream, 1, from, to);
         } finally {
             TimeZone.setDefault(defaultTimeZone);
         }
@@ -63,4 +75,16 @@ public class KmlExportProviderTest {
 
         assertEquals(expected, result);
     }
+
+    @Test
+    public void testPeriodLimit() {
+        Storage storage = mock(Storage.class);
+        Config config = mock(Config.class);
+        when(config.getLong(Keys.REPORT_PERIOD_LIMIT)).thenReturn(30L);
+
+        var provider = new KmlExportProvider(storage, createReportUtils(config, storage));
+
+        assertThrows(IllegalArgumentException.class, () -> provider.generate(
+                new ByteArrayOutputStream(), 1, new Date(0), new Date(60_000)));
+    }
 }
@@ -0,0 +1,89 @@
+package org.traccar.reports;
+
+import org.apache.velocity.app.VelocityEngine;
+import org.junit.jupiter.api.Test;
+import org.traccar.api.security.PermissionsService;
+import org.traccar.config.Config;
+import org.traccar.model.Device;
+import org.traccar.model.Position;
+import org.traccar.reports.common.ReportUtils;
+import org.traccar.storage.Storage;
+import org.traccar.storage.StorageException;
+
+import java.util.Date;
+import java.util.List;
+import java.util.concurrent.atomic.AtomicBoolean;
+import java.util.stream.Stream;
+
+import static org.junit.jupiter.api.Assertions.assertEquals;
+import static org.junit.jupiter.api.Assertions.assertFalse;
+import static org.junit.jupiter.api.Assertions.assertSame;
+import static org.junit.jupiter.api.Assertions.assertThrows;
+import static org.junit.jupiter.api.Assertions.assertTrue;
+import static org.mockito.ArgumentMatchers.any;
+import static org.mockito.ArgumentMatchers.eq;
+import static org.mockito.Mockito.mock;
+import static org.mockito.Mockito.times;
+import static org.mockito.Mockito.verify;
+import static org.mockito.Mockito.when;
+
+public class RouteReportProviderTest {
+
+    private Device createDevice(long id) {
+        Device device = new Device();
+        device.setId(id);
+        return device;
+    }
+
+    private Position createPosition(long deviceId) {
+        Position position = new Position();
+        position.setDeviceId(deviceId);
+        return position;
+    }
+
+    private RouteReportProvider createProvider(Storage storage) {
+        Config config = mock(Config.class);
+        ReportUtils reportUtils = new ReportUtils(
+                config, storage, mock(PermissionsService.class), mock(VelocityEngine.class), null);
+        return new RouteReportProvider(config, reportUtils, storage);
+    }
+
+    @Test
+    public void testDevicesQueriedOneAtATime() throws Exception {
+        Storage storage = mock(Storage.class);
+        when(storage.getObjects(eq(Device.class), any())).thenReturn(List.of(createDevice(1), createDevice(2)));
+
+        AtomicBoolean firstClosed = new AtomicBoolean();
+        AtomicBoolean secondClosed = new AtomicBoolean();
+        when(storage.getObjectsStream(eq(Position.class), any())).thenReturn(
+                Stream.of(createPosition(1)).onClose(() -> firstClosed.set(true)),
+                Stream.of(createPosition(2)).onClose(() -> secondClosed.set(true)));
+
+        try (var positions = createProvider(storage).getObjects(1, List.of(), List.of(), new Date(0), new Date())) {
+            var iterator = positions.iterator();
+
+            assertEquals(1, iterator.next().getDeviceId());
+            verify(storage, times(1)).getObjectsStream(eq(Position.class), any());
+            assertFalse(firstClosed.get());
+
+            assertEquals(2, iterator.next().getDeviceId());
+            assertTrue(firstClosed.get());
+            assertFalse(iterator.hasNext());
+        }
+        assertTrue(secondClosed.get());
+    }
+
+    @Test
+    public void testStorageFailurePropagates() throws Exception {
+        Storage storage = mock(Storage.class);
+        when(storage.getObjects(eq(Device.class), any())).thenReturn(List.of(createDevice(1)));
+        StorageException failure = new StorageException("failure");
+        when(storage.getObjectsStream(eq(Position.class), any())).thenThrow(failure);
+
+        try (var positions = createProvider(storage).getObjects(1, List.of(), List.of(), new Date(0), new Date())) {
+            RuntimeException exception = assertThrows(RuntimeException.class, positions::toList);
+            assertSame(failure, exception.getCause());
+        }
+    }
+
+}
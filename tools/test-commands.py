@@ -3,8 +3,8 @@
 import socket
 import binascii
 
-s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-s.connect(("localhost", 5001))
+s = socket.create_connection(("localhost", 5001), timeout=10)
+s.settimeout(None)
 #s.send(binascii.unhexlify('68680f0504035889905831401700df1a00000d0a'))
 s.send(b"imei:123456789012345,tracker,151030080103,,F,000101.000,A,5443.3834,N,02512.9071,E,0.00,0;")
 
@@ -65,7 +65,7 @@ def course(lat1, lon1, lat2, lon2):
 
 index = 0
 
-conn = httplib.HTTPConnection(server)
+conn = httplib.HTTPConnection(server, timeout=10)
 
 while True:
     (lat1, lon1) = points[index % len(points)]
@@ -2,14 +2,13 @@
 
 import sys
 import os
-import xml.etree.ElementTree
 import urllib
 import urllib.request as urllib2
 import json
 import socket
 import time
-import threading
 import re
+from concurrent.futures import ThreadPoolExecutor
 
 messages = {
     'gps103' : 'imei:123456789012345,help me,1201011201,,F,120100.000,A,6000.0000,N,13000.0000,E,0.00,;',
@@ -133,6 +132,7 @@ messages = {
 
 baseUrl = 'http://localhost:8082'
 user = { 'email' : 'admin', 'password' : 'admin' }
+timeout = 10
 
 debug = '-v' in sys.argv
 
@@ -150,35 +150,39 @@ def load_ports():
 
 def login():
     request = urllib2.Request(baseUrl + '/api/session')
-    response = urllib2.urlopen(request, urllib.parse.urlencode(user).encode())
+    response = urllib2.urlopen(request, urllib.parse.urlencode(user).encode(), timeout=timeout)
     if debug:
         print(f'\nlogin: {json.load(response)!r}\n')
     return response.headers.get('Set-Cookie')
 
+def remove_device(cookie, device_id):
+    request = urllib2.Request(baseUrl + '/api/devices/' + str(device_id))
+    request.add_header('Cookie', cookie)
+    request.get_method = lambda: 'DELETE'
+    urllib2.urlopen(request, timeout=timeout)
+
 def remove_devices(cookie):
     request = urllib2.Request(baseUrl + '/api/devices')
     request.add_header('Cookie', cookie)
-    response = urllib2.urlopen(request)
+    response = urllib2.urlopen(request, timeout=timeout)
     data = json.load(response)
     if debug:
         print(f'\ndevices: {data!r}\n')
-    for device in data:
-        request = urllib2.Request(baseUrl + '/api/devices/' + str(device['id']))
-        request.add_header('Cookie', cookie)
-        request.get_method = lambda: 'DELETE'
-        response = urllib2.urlopen(request)
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        list(pool.map(lambda device: remove_device(cookie, device['id']), data))
 
 def add_device(cookie, unique_id):
     request = urllib2.Request(baseUrl + '/api/devices')
     request.add_header('Cookie', cookie)
     request.add_header('Content-Type', 'application/json')
     device = { 'name' : unique_id, 'uniqueId' : unique_id }
-    response = urllib2.urlopen(request, json.dumps(device).encode())
+    response = urllib2.urlopen(request, json.dumps(device).encode(), timeout=timeout)
     data = json.load(response)
     return data['id']
 
 def send_message(port, message):
     s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    s.settimeout(timeout)
     s.connect(('127.0.0.1', port))
     s.send(message.encode('ascii'))
     time.sleep(0.5)
@@ -191,7 +195,7 @@ def get_protocols(cookie, device_id):
     request.add_header('Cookie', cookie)
     request.add_header('Content-Type', 'application/json')
     request.add_header('Accept', 'application/json')
-    response = urllib2.urlopen(request)
+    response = urllib2.urlopen(request, timeout=timeout)
     protocols = []
     for position in json.load(response):
         protocols.append(position['protocol'])
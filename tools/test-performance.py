@@ -16,12 +16,13 @@ USER = {"email": "admin", "password": "admin"}
 DEVICES = 200
 CREATE_WORKERS = 32
 SEND_INTERVAL = 1.0
+TIMEOUT = 10
 
 
 def login():
     req  = urllib.request.Request(f"{BASE_URL}/api/session")
     data = urllib.parse.urlencode(USER).encode()
-    with urllib.request.urlopen(req, data) as resp:
+    with urllib.request.urlopen(req, data, timeout=TIMEOUT) as resp:
         return resp.headers["Set-Cookie"]
 
 
@@ -32,7 +33,7 @@ def add_device(cookie: str, uid: str):
         data=json.dumps({"name": uid, "uniqueId": uid}).encode()
     )
     try:
-        urllib.request.urlopen(req)
+        urllib.request.urlopen(req, timeout=TIMEOUT)
     except Exception:
         pass
 
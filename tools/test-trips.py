@@ -28,7 +28,7 @@ def send(conn, time, lat, lon, speed):
     conn.request('POST', '?' + urllib.parse.urlencode(params))
     conn.getresponse().read()
 
-conn = httplib.HTTPConnection(server)
+conn = httplib.HTTPConnection(server, timeout=10)
 
 for i in range(0, len(points)):
     (moment, lat, lon, speed) = points[i]